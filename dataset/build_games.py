@@ -9,26 +9,65 @@ Generate an enriched games.json dataset for the Guess-The-Game project.
 - Derives a rich set of attributes from RAWG genres/tags/devs for
   better yes/no question variety.
 
-Output: games.json (around 500 sampled games)
+Output: games.json (around 500 sampled games), plus games.min.json,
+games.json.gz and games_by_franchise.json for runtime use.
+
+RAWG responses (rawg_cache.sqlite) and transformed games
+(.transform_cache.<hash>.pkl) are cached so re-runs are cheap.
 """
 
 from __future__ import annotations
 
+import argparse
+import functools
+import gzip
+import hashlib
 import json
+import logging
+import math
 import os
-import time
+import pickle
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, FrozenSet, Pattern, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # optional: without it every run hits the network
+    requests_cache = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to a single precompiled regex
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json encoder
+    orjson = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # optional: score bucketing falls back to pure Python
+    numba = None
+    np = None
+
+log = logging.getLogger(__name__)
 
 
 # ------------------------------------------------------------
 # 1. Data model
 # ------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     id: int
     name: str
@@ -74,52 +113,100 @@ class Game:
 # 2. Normalisation helpers
 # ------------------------------------------------------------
 
-PLATFORM_MAP: Dict[str, str] = {
+# Every platform name RAWG returns, so normalisation is a single dict hit.
+# None marks platforms that deliberately map to no bucket.
+PLATFORM_MAP: Dict[str, Optional[str]] = {
     "PC": "PC",
+    "macOS": "PC",
+    "Linux": "PC",
     "Nintendo Switch": "Nintendo Switch",
+    "PlayStation": "PlayStation",
+    "PlayStation 2": "PlayStation",
     "PlayStation 3": "PlayStation",
     "PlayStation 4": "PlayStation",
     "PlayStation 5": "PlayStation",
     "PlayStation Vita": "PlayStation",
+    "PS Vita": "PlayStation",
+    "Xbox": "Xbox",
     "Xbox 360": "Xbox",
     "Xbox One": "Xbox",
     "Xbox Series S/X": "Xbox",
     "Android": "Mobile",
     "iOS": "Mobile",
+    "PSP": None,
+    "Nintendo 3DS": None,
+    "Nintendo DS": None,
+    "Nintendo DSi": None,
+    "Wii U": None,
+    "Wii": None,
+    "GameCube": None,
+    "Game Boy Advance": None,
+    "Game Boy Color": None,
+    "Game Boy": None,
+    "SNES": None,
+    "NES": None,
+    "Classic Macintosh": None,
+    "Apple II": None,
+    "Commodore / Amiga": None,
+    "Atari 7800": None,
+    "Atari 5200": None,
+    "Atari 2600": None,
+    "Atari Flashback": None,
+    "Atari 8-bit": None,
+    "Atari ST": None,
+    "Atari Lynx": None,
+    "Atari XEGS": None,
+    "Jaguar": None,
+    "Genesis": None,
+    "SEGA Saturn": None,
+    "SEGA CD": None,
+    "SEGA 32X": None,
+    "SEGA Master System": None,
+    "Dreamcast": None,
+    "Game Gear": None,
+    "Neo Geo": None,
+    "3DO": None,
+    "Web": None,
 }
 
 
+def guess_platform_bucket(platform: str) -> Optional[str]:
+    """
+    Substring fallback for platform names missing from PLATFORM_MAP.
+    """
+    lp: str = platform.lower()
+    if "pc" in lp or "windows" in lp:
+        return "PC"
+    if "playstation" in lp or "ps4" in lp or "ps5" in lp or "ps3" in lp or "vita" in lp:
+        return "PlayStation"
+    if "xbox" in lp:
+        return "Xbox"
+    if "switch" in lp or ("nintendo" in lp and "3ds" not in lp and "ds" not in lp):
+        return "Nintendo Switch"
+    if "android" in lp or "ios" in lp or "mobile" in lp:
+        return "Mobile"
+    return None
+
+
 def normalize_platforms(raw_platforms: List[str]) -> List[str]:
     """
     Map RAWG platform names to a small set of buckets:
     PC / PlayStation / Xbox / Nintendo Switch / Mobile
     """
-    normalized: List[str] = []
+    # Dict as an insertion-ordered set: first-seen bucket order is kept.
+    normalized: Dict[str, None] = {}
 
     for p in raw_platforms:
+        bucket: Optional[str]
         if p in PLATFORM_MAP:
-            bucket: str = PLATFORM_MAP[p]
-            if bucket not in normalized:
-                normalized.append(bucket)
+            bucket = PLATFORM_MAP[p]
         else:
-            lp: str = p.lower()
-            if "pc" in lp or "windows" in lp:
-                if "PC" not in normalized:
-                    normalized.append("PC")
-            elif "playstation" in lp or "ps4" in lp or "ps5" in lp or "ps3" in lp or "vita" in lp:
-                if "PlayStation" not in normalized:
-                    normalized.append("PlayStation")
-            elif "xbox" in lp:
-                if "Xbox" not in normalized:
-                    normalized.append("Xbox")
-            elif "switch" in lp or ("nintendo" in lp and "3ds" not in lp and "ds" not in lp):
-                if "Nintendo Switch" not in normalized:
-                    normalized.append("Nintendo Switch")
-            elif "android" in lp or "ios" in lp or "mobile" in lp:
-                if "Mobile" not in normalized:
-                    normalized.append("Mobile")
-
-    return normalized
+            bucket = guess_platform_bucket(p)
+
+        if bucket is not None:
+            normalized[bucket] = None
+
+    return list(normalized)
 
 
 def bucket_score(score: Optional[float]) -> str:
@@ -140,274 +227,313 @@ def bucket_score(score: Optional[float]) -> str:
     return "<60"
 
 
-def to_lower_list(items: List[str]) -> List[str]:
-    lowered: List[str] = []
-    for item in items:
-        lowered.append(item.lower())
-    return lowered
+# Integer codes produced by the batched bucketing kernel.
+SCORE_BUCKETS: List[str] = ["Unknown", "<60", "60-69", "70-79", "80-89", "90+"]
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _bucket_score_codes(scores: Any, out: Any) -> None:
+        for i in range(scores.shape[0]):
+            s = scores[i]
+            if np.isnan(s):
+                out[i] = 0
+            elif s >= 90.0:
+                out[i] = 5
+            elif s >= 80.0:
+                out[i] = 4
+            elif s >= 70.0:
+                out[i] = 3
+            elif s >= 60.0:
+                out[i] = 2
+            else:
+                out[i] = 1
+
+
+def bucket_scores(scores: List[Optional[float]]) -> List[str]:
+    """
+    bucket_score() over a whole batch; a single JIT-compiled pass when numba
+    is installed.
+    """
+    if numba is None:
+        return [bucket_score(s) for s in scores]
+
+    arr = np.array([np.nan if s is None else s for s in scores], dtype=np.float64)
+    codes = np.empty(arr.shape[0], dtype=np.int8)
+    _bucket_score_codes(arr, codes)
+    return [SCORE_BUCKETS[c] for c in codes.tolist()]
 
 
 # ------------------------------------------------------------
 # 3. Classification helpers (theme / tone / style / etc.)
 # ------------------------------------------------------------
 
-def classify_theme(genres: List[str], tags: List[str]) -> str:
-    g: List[str] = to_lower_list(genres)
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(g + t)
+# Each classifier is a priority-ordered list of (keywords, label) rules.
+# Keywords are matched as substrings of the lowercased, space-joined tag
+# list (so "horror" also fires on "Psychological Horror"). A KeywordScanner
+# finds every keyword present in one pass per game (Aho-Corasick or regex);
+# classifiers then only intersect that hit set with their rule keywords.
+# Theme / camera / setting look at genres + tags, everything else at tags.
+class Rules:
+    def __init__(self, rules: List[Tuple[FrozenSet[str], str]]) -> None:
+        self.rules: List[Tuple[FrozenSet[str], str]] = rules
+        # Union of all rule keywords: most games hit none of a classifier's
+        # keywords, and one disjointness check then settles it.
+        self.keywords: FrozenSet[str] = frozenset().union(*(keywords for keywords, _ in rules))
+
+
+def first_label(rules: Rules, hits: FrozenSet[str], default: str) -> str:
+    if hits.isdisjoint(rules.keywords):
+        return default
+    for keywords, label in rules.rules:
+        if not hits.isdisjoint(keywords):
+            return label
+    return default
+
+
+def all_labels(rules: Rules, hits: FrozenSet[str], default: str) -> List[str]:
+    if hits.isdisjoint(rules.keywords):
+        return [default]
+    labels: List[str] = [label for keywords, label in rules.rules if not hits.isdisjoint(keywords)]
+    if len(labels) == 0:
+        labels.append(default)
+    return labels
+
+
+class KeywordScanner:
+    """
+    Finds which of a fixed set of keywords occur (as substrings) in a string
+    in a single pass: an Aho-Corasick automaton when pyahocorasick is
+    installed, otherwise one precompiled regex. Either way the string is
+    walked once instead of once per keyword.
+    """
+
+    def __init__(self, keywords: FrozenSet[str]) -> None:
+        self.automaton: Any = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for kw in keywords:
+                self.automaton.add_word(kw, kw)
+            self.automaton.make_automaton()
+
+        trie: Dict[str, Any] = {}
+        for kw in keywords:
+            node: Dict[str, Any] = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        # A zero-width lookahead reports a match at every position, and the
+        # greedy trie pattern picks the longest keyword starting there.
+        # Shorter keywords contained in that match (e.g. "gun" in "guns")
+        # are added back via `implied`.
+        self.pattern: Pattern[str] = re.compile("(?=(" + self._trie_pattern(trie) + "))")
+        self.implied: Dict[str, FrozenSet[str]] = {
+            kw: frozenset(other for other in keywords if other in kw) for kw in keywords
+        }
+
+    @staticmethod
+    def _trie_pattern(node: Dict[str, Any]) -> str:
+        branches: List[str] = [
+            re.escape(ch) + KeywordScanner._trie_pattern(child)
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if len(branches) == 0:
+            return ""
 
-    if "horror" in joined or "zombie" in joined or "lovecraftian" in joined:
-        return "Horror"
-    if "post-apocalyptic" in joined or "post apocalypse" in joined or "nuclear" in joined or "wasteland" in joined:
-        return "Post-Apocalyptic"
-    if "sci-fi" in joined or "science fiction" in joined or "space" in joined or "cyberpunk" in joined or "futuristic" in joined:
-        return "Sci-Fi"
-    if "fantasy" in joined or "dragon" in joined or "magic" in joined or "medieval" in joined:
-        return "Fantasy"
-    if "ww2" in joined or "world war" in joined or "historical" in joined or "wwii" in joined:
-        return "Historical"
+        body: str = "|".join(branches)
+        if "" in node:
+            return "(?:" + body + ")?"
+        if len(branches) == 1:
+            return body
+        return "(?:" + body + ")"
 
-    return "Modern / Other"
+    def hits(self, joined: str) -> FrozenSet[str]:
+        """
+        The keywords occurring in an already-lowercased joined string.
+        """
+        if self.automaton is not None:
+            # Reports every (overlapping) occurrence, so no `implied` step.
+            return frozenset(kw for _, kw in self.automaton.iter(joined))
 
+        found: Set[str] = set()
+        for match in self.pattern.finditer(joined):
+            found |= self.implied[match.group(1)]
+        return frozenset(found)
 
-def classify_tone(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    tones: List[str] = []
-    joined: str = " ".join(t)
 
-    if "dark" in joined or "grim" in joined or "gothic" in joined:
-        tones.append("Dark")
-    if "wholesome" in joined or "relaxing" in joined or "cozy" in joined:
-        tones.append("Wholesome")
-    if "comedy" in joined or "funny" in joined or "humor" in joined:
-        tones.append("Comedic")
-    if "emotional" in joined or "story rich" in joined or "narrative" in joined:
-        tones.append("Emotional")
-    if "cute" in joined or "kawaii" in joined:
-        tones.append("Cute")
+THEME_RULES: Rules = Rules([
+    (frozenset({"horror", "zombie", "lovecraftian"}), "Horror"),
+    (frozenset({"post-apocalyptic", "post apocalypse", "nuclear", "wasteland"}), "Post-Apocalyptic"),
+    (frozenset({"sci-fi", "science fiction", "space", "cyberpunk", "futuristic"}), "Sci-Fi"),
+    (frozenset({"fantasy", "dragon", "magic", "medieval"}), "Fantasy"),
+    (frozenset({"ww2", "world war", "historical", "wwii"}), "Historical"),
+])
 
-    if len(tones) == 0:
-        tones.append("Neutral")
 
-    return tones
+def classify_theme(all_hits: FrozenSet[str]) -> str:
+    return first_label(THEME_RULES, all_hits, "Modern / Other")
 
 
-def classify_world_type(tags: List[str]) -> str:
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
+TONE_RULES: Rules = Rules([
+    (frozenset({"dark", "grim", "gothic"}), "Dark"),
+    (frozenset({"wholesome", "relaxing", "cozy"}), "Wholesome"),
+    (frozenset({"comedy", "funny", "humor"}), "Comedic"),
+    (frozenset({"emotional", "story rich", "narrative"}), "Emotional"),
+    (frozenset({"cute", "kawaii"}), "Cute"),
+])
 
-    if "open world" in joined or "sandbox" in joined:
-        return "Open World"
-    if "metroidvania" in joined:
-        return "Metroidvania"
-    if "roguelike" in joined or "roguelite" in joined or "rogue-lite" in joined:
-        return "Level-based"
-    if "hub world" in joined or "hub-based" in joined:
-        return "Hub-based"
 
-    return "Linear / Mixed"
+def classify_tone(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(TONE_RULES, tag_hits, "Neutral")
 
 
-def classify_camera(genres: List[str], tags: List[str]) -> str:
+WORLD_TYPE_RULES: Rules = Rules([
+    (frozenset({"open world", "sandbox"}), "Open World"),
+    (frozenset({"metroidvania"}), "Metroidvania"),
+    (frozenset({"roguelike", "roguelite", "rogue-lite"}), "Level-based"),
+    (frozenset({"hub world", "hub-based"}), "Hub-based"),
+])
+
+
+def classify_world_type(tag_hits: FrozenSet[str]) -> str:
+    return first_label(WORLD_TYPE_RULES, tag_hits, "Linear / Mixed")
+
+
+# Order matters: we prefer 3rd-person if both are present.
+CAMERA_RULES: Rules = Rules([
+    (frozenset({"third-person", "third person", "tps"}), "Third Person"),
+    (frozenset({"first-person", "first person", "fps"}), "First Person"),
+    (frozenset({"isometric"}), "Isometric"),
+    (frozenset({"top-down", "top down"}), "Top-down"),
+    (frozenset({"side-scroller", "side scroller", "2d platformer"}), "Side"),
+])
+
+
+def classify_camera(all_hits: FrozenSet[str]) -> str:
     """
     Camera / perspective style inference, order matters:
     we prefer 3rd-person if both are present.
     """
-    g: List[str] = to_lower_list(genres)
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(g + t)
-
-    if "third-person" in joined or "third person" in joined or "tps" in joined:
-        return "Third Person"
-    if "first-person" in joined or "first person" in joined or "fps" in joined:
-        return "First Person"
-    if "isometric" in joined:
-        return "Isometric"
-    if "top-down" in joined or "top down" in joined:
-        return "Top-down"
-    if "side-scroller" in joined or "side scroller" in joined or "2d platformer" in joined:
-        return "Side"
+    return first_label(CAMERA_RULES, all_hits, "Unknown")
+
+
+# Perspective and camera are the same inference; callers compute it once.
+classify_perspective = classify_camera
+
+
+DIFFICULTY_RULES: Rules = Rules([
+    (frozenset({"souls-like", "soulslike"}), "Souls-like"),
+    (frozenset({"difficult", "hard", "challenging"}), "Hard"),
+    (frozenset({"casual", "relaxing"}), "Easy"),
+])
+
+
+def classify_difficulty(tag_hits: FrozenSet[str]) -> str:
+    return first_label(DIFFICULTY_RULES, tag_hits, "Normal / Unknown")
+
+
+REPLAYABILITY_RULES: Rules = Rules([
+    (frozenset({"roguelike", "roguelite", "procedural generation", "procedurally generated"}), "Roguelike"),
+    (frozenset({"replay value", "replayable", "multiple endings", "choices matter"}), "High"),
+])
+
+
+def classify_replayability(tag_hits: FrozenSet[str]) -> str:
+    return first_label(REPLAYABILITY_RULES, tag_hits, "Medium / Low / Unknown")
+
+
+VISUAL_STYLE_RULES: Rules = Rules([
+    (frozenset({"pixel graphics", "pixel art"}), "Pixel Art"),
+    (frozenset({"retro"}), "Retro"),
+    (frozenset({"anime"}), "Anime"),
+    (frozenset({"realistic"}), "Realistic"),
+    (frozenset({"cartoon", "cartoony"}), "Cartoon"),
+    (frozenset({"stylized"}), "Stylized"),
+    (frozenset({"low poly"}), "Low Poly"),
+    (frozenset({"minimalist"}), "Minimalist"),
+])
 
-    return "Unknown"
 
+def classify_visual_style(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(VISUAL_STYLE_RULES, tag_hits, "Unspecified")
 
-def classify_perspective(genres: List[str], tags: List[str]) -> str:
-    return classify_camera(genres, tags)
-
-
-def classify_difficulty(tags: List[str]) -> str:
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
 
-    if "souls-like" in joined or "soulslike" in joined or "souls-like" in joined:
-        return "Souls-like"
-    if "difficult" in joined or "hard" in joined or "challenging" in joined:
-        return "Hard"
-    if "casual" in joined or "relaxing" in joined:
-        return "Easy"
-
-    return "Normal / Unknown"
-
-
-def classify_replayability(tags: List[str]) -> str:
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
-
-    if "roguelike" in joined or "roguelite" in joined or "procedural generation" in joined or "procedurally generated" in joined:
-        return "Roguelike"
-    if "replay value" in joined or "replayable" in joined or "multiple endings" in joined or "choices matter" in joined:
-        return "High"
-
-    return "Medium / Low / Unknown"
-
-
-def classify_visual_style(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    styles: List[str] = []
-    joined: str = " ".join(t)
-
-    if "pixel graphics" in joined or "pixel art" in joined:
-        styles.append("Pixel Art")
-    if "retro" in joined:
-        styles.append("Retro")
-    if "anime" in joined:
-        styles.append("Anime")
-    if "realistic" in joined:
-        styles.append("Realistic")
-    if "cartoon" in joined or "cartoony" in joined:
-        styles.append("Cartoon")
-    if "stylized" in joined:
-        styles.append("Stylized")
-    if "low poly" in joined:
-        styles.append("Low Poly")
-    if "minimalist" in joined:
-        styles.append("Minimalist")
-
-    if len(styles) == 0:
-        styles.append("Unspecified")
-
-    return styles
-
-
-def classify_combat_style(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    combat: List[str] = []
-    joined: str = " ".join(t)
-
-    if "melee" in joined or "hand-to-hand" in joined or "sword" in joined or "swords" in joined:
-        combat.append("Melee")
-    if "gun" in joined or "guns" in joined or "shooter" in joined or "sniper" in joined or "fps" in joined:
-        combat.append("Guns")
-    if "magic" in joined or "spell" in joined or "wizard" in joined or "mage" in joined:
-        combat.append("Magic")
-    if "stealth" in joined or "sneak" in joined:
-        combat.append("Stealth")
-    if "strategy" in joined or "tactical" in joined or "turn-based" in joined:
-        combat.append("Tactical")
-
-    if len(combat) == 0:
-        combat.append("Unspecified")
-
-    return combat
-
-
-def classify_structure_features(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    feats: List[str] = []
-    joined: str = " ".join(t)
-
-    if "crafting" in joined:
-        feats.append("Crafting")
-    if "survival" in joined:
-        feats.append("Survival")
-    if "skill tree" in joined or "character progression" in joined:
-        feats.append("Skill Tree")
-    if "loot" in joined or "loot-based" in joined:
-        feats.append("Loot")
-    if "base building" in joined or "building" in joined or "colony sim" in joined:
-        feats.append("Base Building")
-    if "procedural generation" in joined or "procedurally generated" in joined:
-        feats.append("Procedural Generation")
-    if "choices matter" in joined or "multiple endings" in joined:
-        feats.append("Branching Story")
-
-    if len(feats) == 0:
-        feats.append("None / Standard")
-
-    return feats
-
-
-def classify_mood(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    moods: List[str] = []
-    joined: str = " ".join(t)
-
-    if "atmospheric" in joined:
-        moods.append("Atmospheric")
-    if "psychological" in joined:
-        moods.append("Psychological")
-    if "mystery" in joined:
-        moods.append("Mysterious")
-    if "thriller" in joined:
-        moods.append("Thrilling")
-    if "story rich" in joined or "narrative" in joined:
-        moods.append("Story-Driven")
-    if "relaxing" in joined or "wholesome" in joined or "cozy" in joined:
-        moods.append("Relaxing")
-
-    if len(moods) == 0:
-        moods.append("Neutral")
-
-    return moods
-
-
-def classify_setting(genres: List[str], tags: List[str]) -> List[str]:
-    g: List[str] = to_lower_list(genres)
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(g + t)
-    settings: List[str] = []
-
-    if "space" in joined or "planet" in joined:
-        settings.append("Space / Sci-Fi")
-    if "underwater" in joined or "ocean" in joined or "sea" in joined:
-        settings.append("Underwater")
-    if "city" in joined or "urban" in joined or "cyberpunk" in joined:
-        settings.append("Urban")
-    if "desert" in joined or "wasteland" in joined:
-        settings.append("Desert / Wasteland")
-    if "island" in joined:
-        settings.append("Island")
-    if "forest" in joined or "jungle" in joined or "wilderness" in joined:
-        settings.append("Wilderness")
-    if "medieval" in joined or "castle" in joined:
-        settings.append("Medieval")
-    if "post-apocalyptic" in joined or "post apocalypse" in joined:
-        settings.append("Post-Apocalyptic")
-
-    if len(settings) == 0:
-        settings.append("Unspecified / Mixed")
-
-    return settings
-
-
-def classify_violence_level(tags: List[str]) -> str:
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
-
-    if "gore" in joined or "gory" in joined or "blood" in joined or "brutal" in joined:
-        return "High"
-    if "violent" in joined or "violence" in joined or "combat" in joined or "shooter" in joined:
-        return "Medium"
-    if "non-violent" in joined or "peaceful" in joined:
-        return "Low"
-
-    return "Unknown / Varies"
-
-
-def classify_developer_bucket(dev_names: List[str]) -> str:
-    d: List[str] = to_lower_list(dev_names)
-    joined: str = " ".join(d)
+COMBAT_STYLE_RULES: Rules = Rules([
+    (frozenset({"melee", "hand-to-hand", "sword", "swords"}), "Melee"),
+    (frozenset({"gun", "guns", "shooter", "sniper", "fps"}), "Guns"),
+    (frozenset({"magic", "spell", "wizard", "mage"}), "Magic"),
+    (frozenset({"stealth", "sneak"}), "Stealth"),
+    (frozenset({"strategy", "tactical", "turn-based"}), "Tactical"),
+])
 
+
+def classify_combat_style(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(COMBAT_STYLE_RULES, tag_hits, "Unspecified")
+
+
+STRUCTURE_FEATURE_RULES: Rules = Rules([
+    (frozenset({"crafting"}), "Crafting"),
+    (frozenset({"survival"}), "Survival"),
+    (frozenset({"skill tree", "character progression"}), "Skill Tree"),
+    (frozenset({"loot", "loot-based"}), "Loot"),
+    (frozenset({"base building", "building", "colony sim"}), "Base Building"),
+    (frozenset({"procedural generation", "procedurally generated"}), "Procedural Generation"),
+    (frozenset({"choices matter", "multiple endings"}), "Branching Story"),
+])
+
+
+def classify_structure_features(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(STRUCTURE_FEATURE_RULES, tag_hits, "None / Standard")
+
+
+MOOD_RULES: Rules = Rules([
+    (frozenset({"atmospheric"}), "Atmospheric"),
+    (frozenset({"psychological"}), "Psychological"),
+    (frozenset({"mystery"}), "Mysterious"),
+    (frozenset({"thriller"}), "Thrilling"),
+    (frozenset({"story rich", "narrative"}), "Story-Driven"),
+    (frozenset({"relaxing", "wholesome", "cozy"}), "Relaxing"),
+])
+
+
+def classify_mood(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(MOOD_RULES, tag_hits, "Neutral")
+
+
+SETTING_RULES: Rules = Rules([
+    (frozenset({"space", "planet"}), "Space / Sci-Fi"),
+    (frozenset({"underwater", "ocean", "sea"}), "Underwater"),
+    (frozenset({"city", "urban", "cyberpunk"}), "Urban"),
+    (frozenset({"desert", "wasteland"}), "Desert / Wasteland"),
+    (frozenset({"island"}), "Island"),
+    (frozenset({"forest", "jungle", "wilderness"}), "Wilderness"),
+    (frozenset({"medieval", "castle"}), "Medieval"),
+    (frozenset({"post-apocalyptic", "post apocalypse"}), "Post-Apocalyptic"),
+])
+
+
+def classify_setting(all_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(SETTING_RULES, all_hits, "Unspecified / Mixed")
+
+
+VIOLENCE_LEVEL_RULES: Rules = Rules([
+    (frozenset({"gore", "gory", "blood", "brutal"}), "High"),
+    (frozenset({"violent", "violence", "combat", "shooter"}), "Medium"),
+    (frozenset({"non-violent", "peaceful"}), "Low"),
+])
+
+
+def classify_violence_level(tag_hits: FrozenSet[str]) -> str:
+    return first_label(VIOLENCE_LEVEL_RULES, tag_hits, "Unknown / Varies")
+
+
+@functools.lru_cache(maxsize=None)
+def classify_developer_bucket(joined: str) -> str:
+    """
+    `joined` is the lowercased, space-joined developer names. Cached, since
+    the same studios recur across many games: repeats are one dict lookup.
+    """
     if "fromsoftware" in joined:
         return "FromSoftware"
     if "rockstar" in joined:
@@ -430,10 +556,12 @@ def classify_developer_bucket(dev_names: List[str]) -> str:
     return "Indie / Other"
 
 
-def classify_developer_region(dev_names: List[str]) -> str:
-    d: List[str] = to_lower_list(dev_names)
-    joined: str = " ".join(d)
-
+@functools.lru_cache(maxsize=None)
+def classify_developer_region(joined: str) -> str:
+    """
+    `joined` is the lowercased, space-joined developer names. Cached like
+    classify_developer_bucket.
+    """
     if "fromsoftware" in joined or "capcom" in joined or "square enix" in joined or "nintendo" in joined or "bandai namco" in joined:
         return "Japan"
     if "ubisoft" in joined or "cd projekt" in joined or "larian" in joined:
@@ -444,35 +572,38 @@ def classify_developer_region(dev_names: List[str]) -> str:
     return "Unknown / Various"
 
 
+# (group name, pattern on the lowercased name, franchise), in priority order.
+FRANCHISE_RULES: List[Tuple[str, str, str]] = [
+    ("gta", r"grand theft auto|gta ", "Grand Theft Auto"),
+    ("cod", r"call of duty", "Call of Duty"),
+    ("ac", r"assassin'?s creed", "Assassin's Creed"),
+    ("souls", r"dark souls|demon'?s souls|bloodborne|elden ring|sekiro", "Soulsborne"),
+    ("re", r"resident evil", "Resident Evil"),
+    ("bf", r"battlefield", "Battlefield"),
+    ("zelda", r"the legend of zelda|^zelda", "The Legend of Zelda"),
+    ("ff", r"final fantasy", "Final Fantasy"),
+    ("farcry", r"far cry", "Far Cry"),
+    ("halo", r"halo", "Halo"),
+    ("forza", r"forza", "Forza"),
+    ("fifa", r"fifa|ea sports fc", "FIFA / EA FC"),
+]
+
+# Every alternative is a lookahead anchored at the start of the name, so they
+# are tried in list order and the highest-priority franchise wins even when a
+# lower one appears earlier in the name. m.lastgroup names the winner.
+FRANCHISE_PATTERN = re.compile(
+    "|".join(f"(?=.*?(?P<{group}>{pattern}))" for group, pattern, _ in FRANCHISE_RULES),
+    re.DOTALL,
+)
+FRANCHISE_BY_GROUP: Dict[str, str] = {group: franchise for group, _, franchise in FRANCHISE_RULES}
+
+
 def detect_franchise(name: str) -> str:
-    lower_name: str = name.lower()
-
-    if "grand theft auto" in lower_name or "gta " in lower_name:
-        return "Grand Theft Auto"
-    if "call of duty" in lower_name:
-        return "Call of Duty"
-    if "assassin's creed" in lower_name or "assassins creed" in lower_name:
-        return "Assassin's Creed"
-    if "dark souls" in lower_name or "demon's souls" in lower_name or "demons souls" in lower_name or "bloodborne" in lower_name or "elden ring" in lower_name or "sekiro" in lower_name:
-        return "Soulsborne"
-    if "resident evil" in lower_name:
-        return "Resident Evil"
-    if "battlefield" in lower_name:
-        return "Battlefield"
-    if "the legend of zelda" in lower_name or lower_name.startswith("zelda"):
-        return "The Legend of Zelda"
-    if "final fantasy" in lower_name:
-        return "Final Fantasy"
-    if "far cry" in lower_name:
-        return "Far Cry"
-    if "halo" in lower_name:
-        return "Halo"
-    if "forza" in lower_name:
-        return "Forza"
-    if "fifa" in lower_name or "ea sports fc" in lower_name:
-        return "FIFA / EA FC"
-
-    return "Standalone / Other"
+    match = FRANCHISE_PATTERN.match(name.lower())
+    if match is None or match.lastgroup is None:
+        return "Standalone / Other"
+
+    return FRANCHISE_BY_GROUP[match.lastgroup]
 
 
 ROMAN_NUMERAL_PATTERN = re.compile(r"^([ivx]+)$", re.IGNORECASE)
@@ -490,16 +621,22 @@ def detect_franchise_entry(name: str) -> str:
 
     match_num = TRAILING_NUMBER_PATTERN.search(last)
     if match_num is not None:
-        return match_num.group(1)
+        return sys.intern(match_num.group(1))
 
     match_roman = ROMAN_NUMERAL_PATTERN.match(last)
     if match_roman is not None:
-        return match_roman.group(1).upper()
+        return sys.intern(match_roman.group(1).upper())
 
     return "Unknown"
 
 
-def classify_esrb(raw_esrb: Optional[Dict[str, Any]], tags: List[str]) -> str:
+ESRB_TAG_RULES: Rules = Rules([
+    (frozenset({"gore", "gory", "blood", "brutal", "strong violence"}), "M"),
+    (frozenset({"horror", "violent", "violence"}), "T"),
+])
+
+
+def classify_esrb(raw_esrb: Optional[Dict[str, Any]], tag_hits: FrozenSet[str]) -> str:
     """
     Use RAWG's esrb_rating if present; otherwise infer from violence/horror tags.
     """
@@ -525,45 +662,43 @@ def classify_esrb(raw_esrb: Optional[Dict[str, Any]], tags: List[str]) -> str:
         if "MATURE" in text or "M " in text:
             return "M"
 
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
+    return first_label(ESRB_TAG_RULES, tag_hits, "Unknown")
 
-    if "gore" in joined or "gory" in joined or "blood" in joined or "brutal" in joined or "strong violence" in joined:
-        return "M"
-    if "horror" in joined or "violent" in joined or "violence" in joined:
-        return "T"
 
-    return "Unknown"
+ESRB_AGE: Dict[str, str] = {
+    "E": "3+",
+    "E10+": "7+",
+    "T": "12+",
+    "M": "16+",
+}
 
 
 def esrb_to_age(esrb: str) -> str:
-    if esrb == "E":
-        return "3+"
-    if esrb == "E10+":
-        return "7+"
-    if esrb == "T":
-        return "12+"
-    if esrb == "M":
-        return "16+"
+    return ESRB_AGE.get(esrb, "Unknown")
 
-    return "Unknown"
 
+MULTIPLAYER_KEYWORDS: FrozenSet[str] = frozenset({"multiplayer", "online co-op", "online pvp"})
+CO_OP_KEYWORDS: FrozenSet[str] = frozenset({"co-op", "cooperative"})
+ONLINE_ONLY_KEYWORDS: FrozenSet[str] = frozenset({"online only"})
+
+MMO_KEYWORDS: FrozenSet[str] = frozenset({"massively multiplayer", "mmo", "mmorpg"})
+BATTLE_ROYALE_KEYWORDS: FrozenSet[str] = frozenset({"battle royale"})
+PVP_KEYWORDS: FrozenSet[str] = frozenset({"online pvp", "pvp"})
+LOCAL_CO_OP_KEYWORDS: FrozenSet[str] = frozenset({"local co-op", "splitscreen", "split screen"})
 
-def classify_multiplayer_mode(multiplayer: bool, co_op: bool, online_only: bool, tags: List[str]) -> str:
-    t: List[str] = to_lower_list(tags)
-    joined: str = " ".join(t)
 
+def classify_multiplayer_mode(multiplayer: bool, co_op: bool, online_only: bool, tag_hits: FrozenSet[str]) -> str:
     if not multiplayer and not co_op:
         return "Singleplayer"
 
-    if "massively multiplayer" in joined or "mmo" in joined or "mmorpg" in joined:
+    if not tag_hits.isdisjoint(MMO_KEYWORDS):
         return "MMO"
-    if "battle royale" in joined:
+    if not tag_hits.isdisjoint(BATTLE_ROYALE_KEYWORDS):
         return "Battle Royale"
-    if "online pvp" in joined or "pvp" in joined:
+    if not tag_hits.isdisjoint(PVP_KEYWORDS):
         return "Competitive Online"
     if co_op:
-        if "local co-op" in joined or "splitscreen" in joined or "split screen" in joined:
+        if not tag_hits.isdisjoint(LOCAL_CO_OP_KEYWORDS):
             return "Local Co-op"
         return "Online Co-op"
     if multiplayer:
@@ -572,24 +707,103 @@ def classify_multiplayer_mode(multiplayer: bool, co_op: bool, online_only: bool,
     return "Unknown"
 
 
-def classify_monetization(tags: List[str]) -> List[str]:
-    t: List[str] = to_lower_list(tags)
-    monetization: List[str] = []
-    joined: str = " ".join(t)
+MONETIZATION_RULES: Rules = Rules([
+    (frozenset({"free to play", "free-to-play"}), "Free to Play"),
+    (frozenset({"in-app purchases", "microtransactions", "in app purchases"}), "Microtransactions"),
+    (frozenset({"dlc"}), "DLC-heavy"),
+    (frozenset({"season pass", "battle pass"}), "Seasonal / Live Service"),
+])
+
+
+def classify_monetization(tag_hits: FrozenSet[str]) -> List[str]:
+    return all_labels(MONETIZATION_RULES, tag_hits, "Paid / Standard")
 
-    if "free to play" in joined or "free-to-play" in joined:
-        monetization.append("Free to Play")
-    if "in-app purchases" in joined or "microtransactions" in joined or "in app purchases" in joined:
-        monetization.append("Microtransactions")
-    if "dlc" in joined:
-        monetization.append("DLC-heavy")
-    if "season pass" in joined or "battle pass" in joined:
-        monetization.append("Seasonal / Live Service")
 
-    if len(monetization) == 0:
-        monetization.append("Paid / Standard")
+def rule_keywords(*rule_lists: Rules) -> FrozenSet[str]:
+    return frozenset().union(*(rules.keywords for rules in rule_lists))
 
-    return monetization
+
+# Every keyword looked for in the genres + tags string / the tags-only string.
+GENRE_TAG_KEYWORDS: FrozenSet[str] = rule_keywords(THEME_RULES, CAMERA_RULES, SETTING_RULES)
+TAG_KEYWORDS: FrozenSet[str] = rule_keywords(
+    TONE_RULES, WORLD_TYPE_RULES, DIFFICULTY_RULES, REPLAYABILITY_RULES,
+    VISUAL_STYLE_RULES, COMBAT_STYLE_RULES, STRUCTURE_FEATURE_RULES, MOOD_RULES,
+    VIOLENCE_LEVEL_RULES, ESRB_TAG_RULES, MONETIZATION_RULES,
+).union(
+    MULTIPLAYER_KEYWORDS, CO_OP_KEYWORDS, ONLINE_ONLY_KEYWORDS,
+    MMO_KEYWORDS, BATTLE_ROYALE_KEYWORDS, PVP_KEYWORDS, LOCAL_CO_OP_KEYWORDS,
+)
+
+GENRE_TAG_SCANNER: KeywordScanner = KeywordScanner(GENRE_TAG_KEYWORDS)
+TAG_SCANNER: KeywordScanner = KeywordScanner(TAG_KEYWORDS)
+
+
+@dataclass(frozen=True, slots=True)
+class TagProfile:
+    """
+    Everything derived purely from a game's genre + tag names.
+    List-valued labels are tuples since profiles are shared via the cache.
+    """
+    tag_hits: FrozenSet[str]
+    camera: str
+    world_type: str
+    theme: str
+    tone: Tuple[str, ...]
+    difficulty: str
+    replayability: str
+    visual_style: Tuple[str, ...]
+    combat_style: Tuple[str, ...]
+    structure_features: Tuple[str, ...]
+    mood: Tuple[str, ...]
+    setting: Tuple[str, ...]
+    violence_level: str
+    multiplayer: bool
+    co_op: bool
+    online_only: bool
+    multiplayer_mode: str
+    monetization: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_tag_profile(genre_names: Tuple[str, ...], tag_names: Tuple[str, ...]) -> TagProfile:
+    """
+    Run every genre/tag classifier once. Memoized on the exact name lists
+    (order included, since keywords may match across adjacent names), so
+    games sharing a genre/tag fingerprint, e.g. franchise entries, are
+    classified only once.
+    """
+    lowered_genres: List[str] = [g.lower() for g in genre_names]
+    lowered_tags: List[str] = [t.lower() for t in tag_names]
+    joined_tags: str = " ".join(lowered_tags)
+    joined_all: str = " ".join(lowered_genres + lowered_tags)
+
+    tag_hits: FrozenSet[str] = TAG_SCANNER.hits(joined_tags)
+    all_hits: FrozenSet[str] = GENRE_TAG_SCANNER.hits(joined_all)
+
+    multiplayer: bool = not tag_hits.isdisjoint(MULTIPLAYER_KEYWORDS)
+    co_op: bool = not tag_hits.isdisjoint(CO_OP_KEYWORDS)
+    online_only: bool = not tag_hits.isdisjoint(ONLINE_ONLY_KEYWORDS)
+
+    return TagProfile(
+        tag_hits=tag_hits,
+        camera=classify_camera(all_hits),
+        world_type=classify_world_type(tag_hits),
+        theme=classify_theme(all_hits),
+        tone=tuple(classify_tone(tag_hits)),
+        difficulty=classify_difficulty(tag_hits),
+        replayability=classify_replayability(tag_hits),
+        visual_style=tuple(classify_visual_style(tag_hits)),
+        combat_style=tuple(classify_combat_style(tag_hits)),
+        structure_features=tuple(classify_structure_features(tag_hits)),
+        mood=tuple(classify_mood(tag_hits)),
+        setting=tuple(classify_setting(all_hits)),
+        violence_level=classify_violence_level(tag_hits),
+        multiplayer=multiplayer,
+        co_op=co_op,
+        online_only=online_only,
+        multiplayer_mode=classify_multiplayer_mode(multiplayer, co_op, online_only, tag_hits),
+        monetization=tuple(classify_monetization(tag_hits)),
+    )
 
 
 # ------------------------------------------------------------
@@ -598,10 +812,89 @@ def classify_monetization(tags: List[str]) -> List[str]:
 
 RAWG_BASE_URL: str = "https://api.rawg.io/api/games"
 
+# RAWG is latency-bound, so pages are fetched concurrently over a pooled,
+# keep-alive session. Rate limiting is left to the pool size plus retries.
+RAWG_MAX_WORKERS: int = 8
+RAWG_POOL_SIZE: int = 16
+
+# The 2010-2024 slice is effectively static, so responses are cached on disk
+# (when requests-cache is installed) and re-runs become local reads.
+RAWG_CACHE_NAME: str = "rawg_cache"
+RAWG_CACHE_EXPIRY: timedelta = timedelta(days=7)
 
-def load_raw_games_from_api() -> List[Dict[str, Any]]:
+# RAWG accepts larger page_size values but never returns more than 40
+# results per page, so 40 is already the fewest round-trips available.
+RAWG_PAGE_SIZE: int = 40
+RAWG_TARGET_GAMES: int = 1200
+
+
+def build_rawg_session(refresh: bool = False) -> requests.Session:
+    """
+    Session with connection pooling and exponential backoff on 429 / 5xx.
+    Uses an on-disk response cache if requests-cache is available;
+    refresh=True clears it first.
+    """
+    retry: Retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=RAWG_POOL_SIZE,
+        pool_maxsize=RAWG_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session: requests.Session
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            RAWG_CACHE_NAME,
+            backend="sqlite",
+            expire_after=RAWG_CACHE_EXPIRY,
+            allowable_codes=(200,),
+            ignored_parameters=["key"],
+        )
+        if refresh:
+            log.info("Clearing RAWG response cache...")
+            session.cache.clear()
+    else:
+        session = requests.Session()
+
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_rawg_page(session: requests.Session, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a single RAWG page. Returns None if the request failed or the
+    response has no results list.
+    """
+    resp = session.get(RAWG_BASE_URL, params=params, timeout=15)
+    if resp.status_code != 200:
+        log.warning(
+            "RAWG request for page %d failed with status %d: %s",
+            params["page"], resp.status_code, resp.text[:200],
+        )
+        return None
+
+    data: Dict[str, Any]
+    if orjson is not None:
+        data = orjson.loads(resp.content)
+    else:
+        data = resp.json()
+    if data.get("results") is None:
+        return None
+
+    return data
+
+
+def load_raw_games_from_api(refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Fetch multiple pages of games from RAWG, filtered by dates and popularity ordering.
+    refresh=True bypasses the on-disk response cache.
     """
     api_key: Optional[str] = os.getenv("RAWG_API_KEY")
     if api_key is None or api_key == "":
@@ -616,11 +909,11 @@ def load_raw_games_from_api() -> List[Dict[str, Any]]:
     end_year: int = 2024
     dates_param: str = f"{start_year}-01-01,{end_year}-12-31"
 
-    page_size: int = 40
-    max_pages: int = 30
+    page_size: int = RAWG_PAGE_SIZE
+    max_pages: int = math.ceil(RAWG_TARGET_GAMES / page_size)
 
-    for page in range(1, max_pages + 1):
-        params: Dict[str, Any] = {
+    def page_params(page: int) -> Dict[str, Any]:
+        return {
             "key": api_key,
             "dates": dates_param,
             "ordering": "-added",
@@ -628,28 +921,53 @@ def load_raw_games_from_api() -> List[Dict[str, Any]]:
             "page": page,
         }
 
-        print(f"Fetching RAWG page {page}/{max_pages}...")
-        resp = requests.get(RAWG_BASE_URL, params=params, timeout=15)
-        if resp.status_code != 200:
-            print(f"WARNING: RAWG request failed with status {resp.status_code}: {resp.text[:200]}")
+    pages: Dict[int, Optional[Dict[str, Any]]] = {}
+
+    # Per-page progress is only useful interactively; CI logs get the summary.
+    show_progress: bool = sys.stderr.isatty()
+
+    with build_rawg_session(refresh) as session, ThreadPoolExecutor(max_workers=RAWG_MAX_WORKERS) as pool:
+        # Page 1 goes first: its total `count` and actual page length tell us
+        # how many pages exist, so we never request pages past the end.
+        first: Optional[Dict[str, Any]] = fetch_rawg_page(session, page_params(1))
+        pages[1] = first
+
+        last_page: int = max_pages
+        if first is not None:
+            count_value: Any = first.get("count")
+            served: int = len(first["results"])
+            if isinstance(count_value, int) and served > 0:
+                # If the API clamped page_size, paginate by what it served.
+                per_page: int = served if served < page_size and count_value > served else page_size
+                last_page = math.ceil(min(count_value, RAWG_TARGET_GAMES) / per_page)
+        if show_progress:
+            log.info("Fetched RAWG page 1/%d", last_page)
+
+        futures: Dict[Future, int] = {}
+        if first is not None:
+            for page in range(2, last_page + 1):
+                futures[pool.submit(fetch_rawg_page, session, page_params(page))] = page
+
+        for future in as_completed(futures):
+            page = futures[future]
+            pages[page] = future.result()
+            if show_progress:
+                log.info("Fetched RAWG page %d/%d (%d done)", page, last_page, len(pages))
+
+    # Reassemble in page order, stopping at the first failed or empty page
+    # exactly like the old sequential loop did.
+    for page in range(1, last_page + 1):
+        data: Optional[Dict[str, Any]] = pages.get(page)
+        if data is None:
             break
-
-        data: Dict[str, Any] = resp.json()
-        results_value: Any = data.get("results")
-        if results_value is None:
-            break
-
-        results: List[Dict[str, Any]] = results_value
+        results: List[Dict[str, Any]] = data["results"]
         if len(results) == 0:
-            print("No more results, stopping pagination.")
+            log.info("No more results, stopping pagination.")
             break
 
-        for r in results:
-            raw_games.append(r)
+        raw_games.extend(results)
 
-        time.sleep(0.2)
-
-    print(f"Total raw games fetched from RAWG: {len(raw_games)}")
+    log.info("Total raw games fetched from RAWG: %d", len(raw_games))
     return raw_games
 
 
@@ -659,6 +977,7 @@ def load_raw_games_from_api() -> List[Dict[str, Any]]:
 
 def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
     games: List[Game] = []
+    scores: List[Optional[float]] = []
     next_id: int = 1
 
     for raw in raw_games:
@@ -707,18 +1026,12 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
         else:
             raw_platforms_list = raw_platforms_list_value
 
-        raw_platform_names: List[str] = []
-        for p in raw_platforms_list:
-            plat_info_value: Any = p.get("platform")
-            if plat_info_value is None:
-                continue
-            plat_info: Dict[str, Any] = plat_info_value
-            plat_name_value: Any = plat_info.get("name")
-            if plat_name_value is None:
-                continue
-            plat_name: str = str(plat_name_value)
-            if plat_name != "":
-                raw_platform_names.append(plat_name)
+        plat_infos: List[Dict[str, Any]] = [
+            p["platform"] for p in raw_platforms_list if p.get("platform") is not None
+        ]
+        raw_platform_names: List[str] = [
+            str(info["name"]) for info in plat_infos if info.get("name") not in (None, "")
+        ]
 
         platforms: List[str] = normalize_platforms(raw_platform_names)
         if len(platforms) == 0:
@@ -731,11 +1044,10 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
         else:
             raw_genres = raw_genres_value
 
-        genre_names: List[str] = []
-        for g in raw_genres:
-            gname_value: Any = g.get("name")
-            if gname_value is not None:
-                genre_names.append(str(gname_value))
+        # Interned: the same handful of genres repeat across every game.
+        genre_names: List[str] = [
+            sys.intern(str(g["name"])) for g in raw_genres if g.get("name") is not None
+        ]
 
         main_genre: str = "Unknown"
         if len(genre_names) > 0:
@@ -748,46 +1060,12 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
         else:
             raw_tags = raw_tags_value
 
-        tag_names: List[str] = []
-        for t in raw_tags:
-            tname_value: Any = t.get("name")
-            if tname_value is not None:
-                tag_names.append(str(tname_value))
-
-        # ----- High-level classifications -----
-        perspective: str = classify_perspective(genre_names, tag_names)
-        camera: str = classify_camera(genre_names, tag_names)
-        world_type: str = classify_world_type(tag_names)
-
-        theme: str = classify_theme(genre_names, tag_names)
-        tone: List[str] = classify_tone(tag_names)
-        difficulty: str = classify_difficulty(tag_names)
-        replayability: str = classify_replayability(tag_names)
-
-        visual_style: List[str] = classify_visual_style(tag_names)
-        combat_style: List[str] = classify_combat_style(tag_names)
-        structure_features: List[str] = classify_structure_features(tag_names)
-        mood: List[str] = classify_mood(tag_names)
-        setting: List[str] = classify_setting(genre_names, tag_names)
-        violence_level: str = classify_violence_level(tag_names)
-
-        # ----- Multiplayer flags -----
-        lowered_tags: List[str] = to_lower_list(tag_names)
-        joined_tags: str = " ".join(lowered_tags)
-        multiplayer: bool = False
-        co_op: bool = False
-        online_only: bool = False
-
-        if "multiplayer" in joined_tags or "online co-op" in joined_tags or "online pvp" in joined_tags:
-            multiplayer = True
-        if "co-op" in joined_tags or "cooperative" in joined_tags:
-            co_op = True
-        if "online only" in joined_tags:
-            online_only = True
-
-        multiplayer_mode: str = classify_multiplayer_mode(multiplayer, co_op, online_only, tag_names)
-
-        # ----- Score bucket -----
+        tag_names: List[str] = [str(t["name"]) for t in raw_tags if t.get("name") is not None]
+
+        # ----- Genre / tag classifications -----
+        profile: TagProfile = classify_tag_profile(tuple(genre_names), tuple(tag_names))
+
+        # ----- Score (bucketed for all games at the end) -----
         meta_value: Any = raw.get("metacritic")
         score: Optional[float]
         if meta_value is None:
@@ -798,7 +1076,7 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
             except ValueError:
                 score = None
 
-        score_bucket: str = bucket_score(score)
+        scores.append(score)
 
         # ----- ESRB + Age -----
         esrb_raw_value: Any = raw.get("esrb_rating")
@@ -807,7 +1085,7 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
         else:
             esrb_raw = esrb_raw_value
 
-        esrb: str = classify_esrb(esrb_raw, tag_names)
+        esrb: str = classify_esrb(esrb_raw, profile.tag_hits)
         age_rating: str = esrb_to_age(esrb)
 
         # ----- Developers -----
@@ -817,22 +1095,16 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
         else:
             raw_devs = raw_devs_value
 
-        dev_names: List[str] = []
-        for d in raw_devs:
-            dname_value: Any = d.get("name")
-            if dname_value is not None:
-                dev_names.append(str(dname_value))
+        dev_names: List[str] = [str(d["name"]) for d in raw_devs if d.get("name") is not None]
 
-        developer_bucket: str = classify_developer_bucket(dev_names)
-        developer_region: str = classify_developer_region(dev_names)
+        joined_devs: str = " ".join([d.lower() for d in dev_names])
+        developer_bucket: str = classify_developer_bucket(joined_devs)
+        developer_region: str = classify_developer_region(joined_devs)
 
         # ----- Franchise detection -----
         franchise: str = detect_franchise(name)
         franchise_entry: str = detect_franchise_entry(name)
 
-        # ----- Monetization -----
-        monetization: List[str] = classify_monetization(tag_names)
-
         # ----- Build final Game -----
         game: Game = Game(
             id=next_id,
@@ -841,36 +1113,75 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
             platforms=platforms,
             genres=genre_names,
             main_genre=main_genre,
-            perspective=perspective,
-            world_type=world_type,
-            camera=camera,
-            theme=theme,
-            tone=tone,
-            difficulty=difficulty,
-            replayability=replayability,
+            perspective=profile.camera,
+            world_type=profile.world_type,
+            camera=profile.camera,
+            theme=profile.theme,
+            tone=list(profile.tone),
+            difficulty=profile.difficulty,
+            replayability=profile.replayability,
             developer_bucket=developer_bucket,
             developer_region=developer_region,
             franchise=franchise,
             franchise_entry=franchise_entry,
             esrb=esrb,
             age_rating=age_rating,
-            violence_level=violence_level,
-            visual_style=visual_style,
-            combat_style=combat_style,
-            structure_features=structure_features,
-            mood=mood,
-            setting=setting,
-            monetization=monetization,
-            multiplayer=multiplayer,
-            co_op=co_op,
-            online_only=online_only,
-            multiplayer_mode=multiplayer_mode,
-            score_bucket=score_bucket,
+            violence_level=profile.violence_level,
+            visual_style=list(profile.visual_style),
+            combat_style=list(profile.combat_style),
+            structure_features=list(profile.structure_features),
+            mood=list(profile.mood),
+            setting=list(profile.setting),
+            monetization=list(profile.monetization),
+            multiplayer=profile.multiplayer,
+            co_op=profile.co_op,
+            online_only=profile.online_only,
+            multiplayer_mode=profile.multiplayer_mode,
+            score_bucket="Unknown",
         )
 
         games.append(game)
         next_id += 1
 
+    for game, score_bucket in zip(games, bucket_scores(scores)):
+        game.score_bucket = score_bucket
+
+    return games
+
+
+TRANSFORM_CACHE_PREFIX: str = ".transform_cache."
+
+
+def load_or_transform(raw_games: List[Dict[str, Any]]) -> List[Game]:
+    """
+    transform_raw_to_games() is deterministic in (raw_games, this script's
+    code), so its result is pickled under a hash of both and reused on
+    re-runs. Editing any classifier or fetching new data changes the hash.
+    """
+    digest = hashlib.sha256()
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    digest.update(dumps_compact(raw_games))
+    cache_path: str = f"{TRANSFORM_CACHE_PREFIX}{digest.hexdigest()[:16]}.pkl"
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                games: List[Game] = pickle.load(f)
+            log.info("Loaded transformed games from %s", cache_path)
+            return games
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as exc:
+            log.warning("Ignoring unreadable transform cache %s: %s", cache_path, exc)
+
+    games = transform_raw_to_games(raw_games)
+
+    # Only the current cache is worth keeping.
+    for name in os.listdir("."):
+        if name.startswith(TRANSFORM_CACHE_PREFIX) and name.endswith(".pkl") and name != cache_path:
+            os.remove(name)
+    with open(cache_path, "wb") as f:
+        pickle.dump(games, f, protocol=5)
+
     return games
 
 
@@ -879,34 +1190,138 @@ def transform_raw_to_games(raw_games: List[Dict[str, Any]]) -> List[Game]:
 # ------------------------------------------------------------
 
 def sample_games(games: List[Game], target_size: int) -> List[Game]:
+    """
+    Sample stratified by main_genre: each genre keeps its share of the full
+    set (at least one game, so rare genres survive), and the remaining slots
+    are filled at random from everything not yet picked.
+    """
     import random
 
     if len(games) <= target_size:
         return games
 
-    return random.sample(games, target_size)
+    by_genre: Dict[str, List[Game]] = {}
+    for g in games:
+        by_genre.setdefault(g.main_genre, []).append(g)
+
+    sampled: List[Game] = []
+    for genre_games in by_genre.values():
+        quota: int = max(1, len(genre_games) * target_size // len(games))
+        sampled.extend(random.sample(genre_games, quota))
+
+    if len(sampled) > target_size:
+        # More genres than slots: the minimum of one per genre overshot.
+        sampled = random.sample(sampled, target_size)
+    else:
+        picked: Set[int] = {id(g) for g in sampled}
+        rest: List[Game] = [g for g in games if id(g) not in picked]
+        sampled.extend(random.sample(rest, target_size - len(sampled)))
+
+    random.shuffle(sampled)
+    return sampled
+
+
+def dataclass_fields(obj: Any) -> Dict[str, Any]:
+    """
+    JSON `default` hook: a shallow field dict for dataclasses. Unlike
+    asdict(), list fields are referenced as-is rather than deep-copied.
+    """
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """
+    UTF-8 JSON with 2-space indentation, via orjson when available.
+    """
+    if orjson is not None:
+        # orjson serialises dataclasses natively; no intermediate dict.
+        return orjson.dumps(obj, default=dataclass_fields, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, default=dataclass_fields, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """
+    Minified UTF-8 JSON, via orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=dataclass_fields)
+    return json.dumps(obj, default=dataclass_fields, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_games_json(games: List[Game], out_path: str) -> None:
+    """
+    Stream games to disk one at a time rather than building the full list
+    of dicts first. Output matches json.dump(..., indent=2).
+    """
+    with open(out_path, "wb") as f:
+        f.write(b"[")
+        for i, g in enumerate(games):
+            if i > 0:
+                f.write(b",")
+            # Nest each object one level deeper, as if inside the array.
+            f.write(b"\n  " + dumps_indented(g).replace(b"\n", b"\n  "))
+        f.write(b"\n]" if len(games) > 0 else b"]")
+
+
+def write_runtime_variants(games: List[Game], out_dir: str) -> List[str]:
+    """
+    Smaller artifacts for serving to the game at runtime:
+    - games.min.json: no whitespace
+    - games.json.gz: the minified JSON, gzipped
+    - games_by_franchise.json: franchise -> game ids, for direct lookups
+    Returns the written paths.
+    """
+    minified: bytes = dumps_compact(games)
+
+    min_path: str = os.path.join(out_dir, "games.min.json")
+    with open(min_path, "wb") as f:
+        f.write(minified)
+
+    gz_path: str = os.path.join(out_dir, "games.json.gz")
+    with gzip.open(gz_path, "wb", compresslevel=9) as f:
+        f.write(minified)
+
+    by_franchise: Dict[str, List[int]] = {}
+    for g in games:
+        by_franchise.setdefault(g.franchise, []).append(g.id)
+
+    index_path: str = os.path.join(out_dir, "games_by_franchise.json")
+    with open(index_path, "wb") as f:
+        f.write(dumps_compact(by_franchise))
+
+    return [min_path, gz_path, index_path]
 
 
 def main() -> None:
-    print("Loading raw games...")
-    raw_games: List[Dict[str, Any]] = load_raw_games_from_api()
-    print(f"Raw games count: {len(raw_games)}")
+    parser = argparse.ArgumentParser(description="Build games.json from the RAWG API.")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached RAWG responses and re-fetch every page",
+    )
+    args = parser.parse_args()
 
-    transformed: List[Game] = transform_raw_to_games(raw_games)
-    print(f"After filtering/transform: {len(transformed)}")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    final_games: List[Game] = sample_games(transformed, target_size=500)
-    print(f"Final sample size: {len(final_games)}")
+    log.info("Loading raw games...")
+    raw_games: List[Dict[str, Any]] = load_raw_games_from_api(refresh=args.refresh)
+    log.info("Raw games count: %d", len(raw_games))
+
+    transformed: List[Game] = load_or_transform(raw_games)
+    log.info("After filtering/transform: %d", len(transformed))
 
-    data: List[Dict[str, Any]] = []
-    for g in final_games:
-        data.append(asdict(g))
+    final_games: List[Game] = sample_games(transformed, target_size=500)
+    log.info("Final sample size: %d", len(final_games))
 
     out_path: str = "games.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_games_json(final_games, out_path)
+
+    log.info("Wrote %d games to %s", len(final_games), out_path)
 
-    print(f"Wrote {len(final_games)} games to {out_path}")
+    for path in write_runtime_variants(final_games, os.path.dirname(out_path)):
+        log.info("Wrote %s", path)
 
 
 if __name__ == "__main__":